@@ -1,8 +1,12 @@
 from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
 from aquacrop.utils import prepare_weather, get_filepath
 from dataclasses import dataclass
+import atexit
+import functools
 import logging
-import itertools
+import logging.handlers
+import queue
+import copy
 import random
 
 from datetime import datetime, timedelta
@@ -15,7 +19,10 @@ import pandas as pd
 class FarmSector:
     model: AquaCropModel
     sector_id: str
-    canopy_cover_history: list[float]
+    canopy_cover_history: np.ndarray # preallocated for the whole simulation, see history_len
+    history_len: int = 0
+    is_dry: bool = False # uses taw_penalty
+    is_pest: bool = False # uses cc_penalty
 
 @dataclass
 class SessionWeather:
@@ -24,6 +31,89 @@ class SessionWeather:
     max_temp: float
     precipitation: float
 
+@functools.lru_cache(maxsize=None)
+def _weather_filepath(filename: str) -> str:
+    """Resolve a bundled aquacrop weather file path once"""
+    return get_filepath(filename)
+
+@functools.lru_cache(maxsize=None)
+def _cached_weather(path: str) -> pd.DataFrame:
+    """Parse a weather file once and reuse the DataFrame on later calls"""
+    return prepare_weather(path)
+
+# Weather columns used for forecasts, mapped to the keys the UI expects
+FORECAST_COLUMNS: dict[str, str] = {
+    "MinTemp": "min_temp",
+    "MaxTemp": "max_temp",
+    "Precipitation": "precipitation",
+    "ReferenceET": "et0",
+}
+
+def _forecast_records(weather_slice: pd.DataFrame) -> list[dict[str, float]]:
+    """Project a slice of weather rows into per-day forecast dicts"""
+    return (weather_slice.loc[:, list(FORECAST_COLUMNS)]
+            .rename(columns=FORECAST_COLUMNS)
+            .astype(float)
+            .to_dict('records'))
+
+def _build_model(soil_type: str, weather_df: pd.DataFrame) -> AquaCropModel:
+    """Build and initialize a model for the given soil type"""
+    model = AquaCropModel(
+        sim_start_time='1979/10/01',
+        sim_end_time='1985/05/30',
+        weather_df=weather_df,
+        soil=Soil(soil_type=soil_type),
+        crop=Crop('Wheat', planting_date='10/01'),
+        initial_water_content=InitialWaterContent(value=['FC'])
+    )
+    model._initialize()
+    return model
+
+
+def _advance_sector(
+    model: AquaCropModel,
+    sector_id: str,
+    days: int,
+    taw_penalty: float,
+    is_dry: bool,
+    cc_penalty: float,
+    cc_penalty_start: int,
+    is_pest: bool,
+) -> list[float]:
+    """Advance a single sector's model in place by `days` days, returning its new canopy cover history"""
+    logger = logging.getLogger(__name__)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    history: list[float] = []
+    # These are invariant across the day loop; the model mutates its structs in place
+    clock = model._clock_struct
+    init_cond = model._init_cond
+    perform_timestep = model._perform_timestep
+    history_append = history.append
+    taw_decay = 1 - taw_penalty
+    cc_decay = 1 - cc_penalty
+    for _ in range(days):
+        if clock.model_is_finished:
+            break
+        # Check for sector buffs / debuffs
+        if is_dry:
+            # Lose taw_penalty of TAW per day. Assign a new array rather than scaling in place:
+            # AquaCrop aliases th elsewhere (thini = th) and resets th from it each season
+            new_th = init_cond.th * taw_decay
+            if debug_enabled:
+                logger.debug("Sector %s TAW debuff. Old: %s new: %s", sector_id, init_cond.th, new_th)
+            init_cond.th = new_th
+        if is_pest and (init_cond.dap > cc_penalty_start):
+            # Lose a percentage of canopy cover due to pest infestation
+            old_cc = init_cond.canopy_cover
+            new_cc = old_cc * cc_decay
+            init_cond.canopy_cover = new_cc
+            logger.debug("Sector %s CC debuff. Old: %s new: %s", sector_id, old_cc, new_cc)
+
+        perform_timestep()
+        history_append(init_cond.canopy_cover)
+    return history
+
+
 class AquaCropManager:
     def __init__(self, grid_size: tuple[int, int] = (4, 4)):
         self.grid_size: tuple[int, int] = grid_size
@@ -34,10 +124,21 @@ class AquaCropManager:
         self.session_days: int = 30 # each "/step" is 30 days
         self.previous_session: datetime | None = None
         self.current_session: datetime
-        self.dry_sectors: list[str] = [] # uses taw_penalty
-        self.pest_sectors: list[str] = [] # uses cc_penalty
+        self._current_date_str: str = "1979-10-01" # refreshed whenever current_session moves
+        self.dry_sectors: set[str] = set() # uses taw_penalty
+        self.pest_sectors: set[str] = set() # uses cc_penalty
+        # weather_data() result for the (previous, current) session it was computed for
+        self._weather_cache_key: tuple[datetime | None, datetime] | None = None
+        self._weather_cache: tuple[SessionWeather | None, SessionWeather] | None = None
         self.logger: logging.Logger
         self.weather: pd.DataFrame
+        # Struct-of-arrays view of the current sector values, indexed in _sector_ids order
+        self._sector_ids: list[str] = []
+        self._canopy: np.ndarray = np.empty(0)
+        self._biomass: np.ndarray = np.empty(0)
+        self._hydration: np.ndarray = np.empty(0)
+        # get_current_canopy_cover() result for the current arrays; dropped whenever they're refreshed
+        self._canopy_cover_cache: dict[str, float] | None = None
         self.setup_logging()
         self.initialize_farm()
 
@@ -51,76 +152,85 @@ class AquaCropManager:
         grid = np.full((len(rows), len(cols)), np.nan)
         
         # Fill grid with values
+        row_ix = {r: i for i, r in enumerate(rows)}
+        col_ix = {c: j for j, c in enumerate(cols)}
         for sector, value in sector_values.items():
-            row_idx = rows.index(sector[0])
-            col_idx = cols.index(sector[1])
-            grid[row_idx, col_idx] = value
+            grid[row_ix[sector[0]], col_ix[sector[1]]] = value
         
         # Print grid with headers
         pretty_str_lines.append("    " + "   ".join(cols))  # Column headers
+        missing = np.isnan(grid)
         for i, row in enumerate(rows):
-            row_str = f"{row} | "
-            for j, col in enumerate(cols):
-                if not np.isnan(grid[i, j]):
-                    row_str += f"{grid[i, j]:.2f} "
-                else:
-                    row_str += "  -   "
-            pretty_str_lines.append(row_str)
+            cells = ["  -   " if is_missing else f"{value:.2f} "
+                     for value, is_missing in zip(grid[i], missing[i])]
+            pretty_str_lines.append(f"{row} | " + "".join(cells))
 
         return "\n".join(pretty_str_lines)
     
     def setup_logging(self) -> None:
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
+        # basicConfig is a no-op once the root logger is configured, so only start a listener if it will be used
+        if not logging.getLogger().handlers:
+            # File / terminal writes happen on the listener's thread; the simulation only enqueues records
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                log_queue,
                 logging.FileHandler('log.txt'),
                 logging.StreamHandler()
-            ]
-        )
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[logging.handlers.QueueHandler(log_queue)]
+            )
         self.logger = logging.getLogger(__name__)
         self.logger.info("AquaCropManager initialized with %s grid", self.grid_size)
     
     def initialize_farm(self) -> None:
         """Initialize 4x4 farm with hardcoded parameters"""
-        weather_data = prepare_weather(get_filepath('tunis_climate.txt'))
-        default_soil_type = Soil(soil_type='SandyLoam')
-        bad_soil_type = Soil(soil_type = 'Sand') # Not bad for all crops ... maybe just for this one.
-        wheat = Crop('Wheat', planting_date='10/01')
-        InitWC = InitialWaterContent(value=['FC'])
+        weather_data = _cached_weather(_weather_filepath('tunis_climate.txt'))
+        default_soil_type = 'SandyLoam'
+        bad_soil_type = 'Sand' # Not bad for all crops ... maybe just for this one.
         
         alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
-        self.weather = weather_data
+        # Index by date so session windows are sliced by binary search rather than a full mask
+        self.weather = weather_data.set_index('Date').sort_index()
 
         # Pick two random sectors to have bad_soil_type
         all_points = [(i, j) for i in range(self.grid_size[0]) for j in range(self.grid_size[1])]
         dry_sectors_xy: list[tuple[int,int]] = random.sample(all_points, 2)
         pest_sectors_xy: list[tuple[int,int]] = random.sample(all_points, 1)
 
-        
+        sector_ids: list[str] = []
         for row in range(self.grid_size[0]):
             for col in range(self.grid_size[1]):
                 sector_id = f"{alphabet[row]}{col+1}"
                 if (row,col) in dry_sectors_xy:
-                    self.dry_sectors.append(sector_id)
+                    self.dry_sectors.add(sector_id)
                     self.logger.info(f"Sector {sector_id} will have taw penalties on every step")
                 if (row,col) in pest_sectors_xy:
-                    self.pest_sectors.append(sector_id)
+                    self.pest_sectors.add(sector_id)
                     self.logger.info(f"Sector {sector_id} will have cc penalties after {self.cc_penalty_start}")
-                model = AquaCropModel(
-                    sim_start_time='1979/10/01',
-                    sim_end_time='1985/05/30',
-                    weather_df=weather_data,
-                    soil=default_soil_type,
-                    crop=wheat,
-                    initial_water_content=InitWC
-                )
-                model._initialize()
-                self.sectors[sector_id] = FarmSector(model, sector_id, [])
+                sector_ids.append(sector_id)
 
+        # Every sector starts from identical parameters, so initialize one template model
+        # and deep copy it per sector instead of re-running _initialize for each one
+        template = _build_model(default_soil_type, weather_data)
+        max_days = template._clock_struct.n_steps
+        for sector_id in sector_ids:
+            self.sectors[sector_id] = FarmSector(
+                copy.deepcopy(template), sector_id, np.empty(max_days, dtype=np.float32),
+                is_dry=sector_id in self.dry_sectors,
+                is_pest=sector_id in self.pest_sectors,
+            )
+
+        self._sector_ids = list(self.sectors)
+        self._refresh_sector_arrays()
         self.current_session = self.get_session_date()
+        self._current_date_str = self.current_session.strftime("%Y-%m-%d")
         
         initial_canopy_cover = self.get_current_canopy_cover()
         self.logger.info("Farm initialized - Initial canopy cover: %s", 
@@ -129,30 +239,30 @@ class AquaCropManager:
     def step_simulation(self, days: int = 30) -> None:
         """Step all sectors forward by specified days"""
         self.logger.info("Stepping simulation by %d days", days)
-        
-        for day in range(days):
-            for sector in self.sectors.values():
-                if not sector.model._clock_struct.model_is_finished:
-                    # Check for sector buffs / debuffs
-                    if sector.sector_id in self.dry_sectors:
-                        # Lose self.taw_penalty of TAW per day
-                        old_th = sector.model._init_cond.th
-                        sector.model._init_cond.th = sector.model._init_cond.th * (1 - self.taw_penalty)
-                        self.logger.debug(f"Sector {sector.sector_id} TAW debuff. Old: {old_th} new: {sector.model._init_cond.th}")
-                    if (sector.sector_id in self.pest_sectors) and (sector.model._init_cond.dap > self.cc_penalty_start):
-                        # Lose a percentage of canopy cover due to pest infestation
-                        old_cc = sector.model._init_cond.canopy_cover
-                        new_cc = old_cc * (1 - self.cc_penalty)
-                        sector.model._init_cond.canopy_cover = new_cc
-                        self.logger.debug(f"Sector {sector.sector_id} CC debuff. Old: {old_cc} new: {new_cc}")
-
-                    sector.model._perform_timestep()
-                    canopy_cover = sector.model._init_cond.canopy_cover
-                    sector.canopy_cover_history.append(canopy_cover)
-            
-        
+
+        # Finished sectors have nothing left to step
+        active = [sector for sector in self.sectors.values()
+                  if not sector.model._clock_struct.model_is_finished]
+        if not active:
+            self.logger.info("All sectors have finished, nothing to step")
+            return
+
+        # Each sector runs all of its days before the next starts, keeping its state hot
+        for sector in active:
+            history = _advance_sector(
+                sector.model, sector.sector_id, days,
+                self.taw_penalty, sector.is_dry,
+                self.cc_penalty, self.cc_penalty_start, sector.is_pest,
+            )
+            end = sector.history_len + len(history)
+            sector.canopy_cover_history[sector.history_len:end] = history
+            sector.history_len = end
+        self._refresh_sector_arrays()
+
         # Update session
+        self.previous_session = self.current_session
         self.current_session = self.get_session_date()
+        self._current_date_str = self.current_session.strftime("%Y-%m-%d")
         # Log final canopy cover after all days
         canopy_cover = self.get_current_canopy_cover()
         biomass = self.get_current_biomass()
@@ -162,25 +272,47 @@ class AquaCropManager:
         self.logger.info(f"Final canopy cover: {pretty_canopy}")
         self.logger.info(f"Final biomass: {pretty_biomass}")
     
-    def get_canopy_cover_values(self) -> dict[str, list[float]]:
+    def get_canopy_cover_values(self) -> dict[str, np.ndarray]:
         """Extract canopy cover values for each sector"""
-        return {sector_id: sector.canopy_cover_history 
+        return {sector_id: sector.canopy_cover_history[:sector.history_len]
                 for sector_id, sector in self.sectors.items()}
     
+    def _refresh_sector_arrays(self) -> None:
+        """Copy each sector's current model values into the per-sector arrays"""
+        n_sectors = len(self._sector_ids)
+        self._canopy = np.empty(n_sectors)
+        self._biomass = np.empty(n_sectors)
+        self._hydration = np.empty(n_sectors)
+        self._canopy_cover_cache = None
+        for idx, sector_id in enumerate(self._sector_ids):
+            init_cond = self.sectors[sector_id].model._init_cond
+            self._canopy[idx] = init_cond.canopy_cover
+            self._biomass[idx] = init_cond.biomass
+            self._hydration[idx] = init_cond.th[0] # top level moisture level
+        # Handed out directly by get_canopy_cover_array, so callers can't write through it
+        self._canopy.flags.writeable = False
+
+    def get_sector_ids(self) -> list[str]:
+        """Sector ids, in the order used by the per-sector arrays"""
+        return self._sector_ids
+
+    def get_canopy_cover_array(self) -> np.ndarray:
+        """Get current canopy cover as a read-only array aligned with get_sector_ids()"""
+        return self._canopy
+
     def get_current_canopy_cover(self) -> dict[str, float]:
-        """Get current canopy cover for each sector"""
-        return {sector_id: sector.model._init_cond.canopy_cover 
-                for sector_id, sector in self.sectors.items()}
+        """Get current canopy cover for each sector (shared between callers until the next step, so don't mutate it)"""
+        if self._canopy_cover_cache is None:
+            self._canopy_cover_cache = dict(zip(self._sector_ids, self._canopy.tolist()))
+        return self._canopy_cover_cache
 
     def get_current_biomass(self) -> dict[str, float]:
-        """Get current canopy cover for each sector"""
-        return {sector_id: sector.model._init_cond.biomass 
-                for sector_id, sector in self.sectors.items()}
+        """Get current biomass for each sector"""
+        return dict(zip(self._sector_ids, self._biomass.tolist()))
 
     def get_current_hydration(self) -> dict[str, float]:
         """Get top level theta (hydration) for each sector"""
-        return {sector_id: sector.model._init_cond.th[0] # top level moisture level
-                for sector_id, sector in self.sectors.items()}
+        return dict(zip(self._sector_ids, self._hydration.tolist()))
     
     def get_current_season(self) -> int:
         """Get current season from the first sector's model"""
@@ -196,64 +328,55 @@ class AquaCropManager:
         return step_start_time
     
     def get_current_date(self) -> str:
-        """Get current date from the first sector's model"""
-        if not self.sectors:
-            return "1979-10-01"
-        first_sector = next(iter(self.sectors.values()))
-        timestamp = first_sector.model._clock_struct.step_start_time
-        try:
-            return timestamp.strftime("%Y-%m-%d")
-        except AttributeError:
-            # Fallback if timestamp is not a datetime-like object
-            return "1979-10-01"
+        """Get current date, cached when the session date changes"""
+        return self._current_date_str
 
     def weather_data(self) -> tuple[SessionWeather | None, SessionWeather]:
         # Return the previous session weather
         # Return the forecasted high / lows (add a fudge factor)
 
+        # Only depends on the session dates, so reuse it until the simulation steps
+        cache_key = (self.previous_session, self.current_session)
+        if self._weather_cache is not None and cache_key == self._weather_cache_key:
+            return self._weather_cache
+
         wdf = self.weather
 
         # If no previous session, don't return data for that
         if self.previous_session is None:
             prevSessionWeather = None
         else:
-            prevSessionWeatherDf = wdf[
-                (wdf['Date'] >= previous_session) & 
-                (wdf['Date'] <= current_session)
-            ]
-            # Calculate the statistics
-            lowest_low: float = prevSessionWeatherDf['MinTemp'].min()
-            highest_high: float = prevSessionWeatherDf['MaxTemp'].max()
-            precipitation_sum: float = prevSessionWeatherDf['Precipitation'].sum()
+            prevSessionWeatherDf = wdf.loc[self.previous_session:self.current_session]
+            # Calculate the statistics in a single pass
+            stats = prevSessionWeatherDf.agg({'MinTemp': 'min', 'MaxTemp': 'max', 'Precipitation': 'sum'})
 
             # Create the dataclass instance
             prevSessionWeather = SessionWeather(
                 session_date=self.previous_session,
-                min_temp=lowest_low,
-                max_temp=highest_high,
-                precipitation=precipitation_sum
+                min_temp=stats['MinTemp'],
+                max_temp=stats['MaxTemp'],
+                precipitation=stats['Precipitation']
             )
 
 
         # For forecasts, take the average min, average max, and avg precipitation * session step length
-        forecastSessionWeatherDf = wdf[
-            (wdf['Date'] > self.current_session) & 
-            (wdf['Date'] <= self.current_session + timedelta(days=self.session_days))
+        # Weather rows are daily, so the day after the current session is the first one after it
+        forecastSessionWeatherDf = wdf.loc[
+            self.current_session + timedelta(days=1):self.current_session + timedelta(days=self.session_days)
         ]
         # Calculate the statistics
-
-        forecast_low: float = np.average(forecastSessionWeatherDf['MinTemp'])
-        forecast_high: float = np.average(forecastSessionWeatherDf['MaxTemp'])
-        forecast_precip: float = np.average(forecastSessionWeatherDf['Precipitation']) * 30
+        forecast_means = forecastSessionWeatherDf[['MinTemp', 'MaxTemp', 'Precipitation']].mean()
 
         forecastSessionWeather = SessionWeather(
             session_date=self.current_session,
-            min_temp=forecast_low,
-            max_temp=forecast_high,
-            precipitation=forecast_precip
+            min_temp=forecast_means['MinTemp'],
+            max_temp=forecast_means['MaxTemp'],
+            precipitation=forecast_means['Precipitation'] * 30
         )
 
-        return (prevSessionWeather, forecastSessionWeather)
+        self._weather_cache_key = cache_key
+        self._weather_cache = (prevSessionWeather, forecastSessionWeather)
+        return self._weather_cache
 
 
     def get_current_weather(self) -> dict[str, float]:
@@ -285,43 +408,26 @@ class AquaCropManager:
         weather_data = first_sector.model.weather_df
         
         # Debug logging
-        self.logger.debug(f"Weather forecast: current_step={current_step}, weather_data_length={len(weather_data)}")
+        self.logger.debug("Weather forecast: current_step=%s, weather_data_length=%s", current_step, len(weather_data))
         
         # If we're at the end of the simulation, return empty forecast
         if current_step >= len(weather_data):
             self.logger.warning(f"Current step {current_step} exceeds weather data length {len(weather_data)}")
             return []
         
-        forecast = []
-        for i in range(current_step, min(current_step + days, len(weather_data))):
-            row = weather_data.iloc[i]
-            forecast.append({
-                "min_temp": float(row["MinTemp"]),
-                "max_temp": float(row["MaxTemp"]),
-                "precipitation": float(row["Precipitation"]),
-                "et0": float(row["ReferenceET"])
-            })
+        forecast = _forecast_records(weather_data.iloc[current_step:min(current_step + days, len(weather_data))])
         
-        self.logger.debug(f"Weather forecast result: {len(forecast)} days")
+        self.logger.debug("Weather forecast result: %d days", len(forecast))
         return forecast
     
     def _get_sample_weather_forecast(self, days: int = 30) -> list[dict[str, float]]:
         """Get sample weather forecast from the initial weather data"""
         try:
-            from aquacrop.utils import prepare_weather, get_filepath
-            weather_data = prepare_weather(get_filepath('tunis_climate.txt'))
+            weather_data = _cached_weather(_weather_filepath('tunis_climate.txt'))
             
-            forecast = []
-            for i in range(min(days, len(weather_data))):
-                row = weather_data.iloc[i]
-                forecast.append({
-                    "min_temp": float(row["MinTemp"]),
-                    "max_temp": float(row["MaxTemp"]),
-                    "precipitation": float(row["Precipitation"]),
-                    "et0": float(row["ReferenceET"])
-                })
+            forecast = _forecast_records(weather_data.iloc[:min(days, len(weather_data))])
             
-            self.logger.debug(f"Sample weather forecast: {len(forecast)} days")
+            self.logger.debug("Sample weather forecast: %d days", len(forecast))
             return forecast
         except Exception as e:
             self.logger.error(f"Error getting sample weather forecast: {e}")
@@ -342,7 +448,7 @@ class AquaCropManager:
         current_step = first_sector.model._clock_struct.time_step_counter
         
         # Debug logging
-        self.logger.debug(f"Previous precipitation: current_step={current_step}")
+        self.logger.debug("Previous precipitation: current_step=%s", current_step)
         
         # If this is the first session, return 0
         if current_step <= 30:
@@ -352,10 +458,8 @@ class AquaCropManager:
         weather_data = first_sector.model.weather_df
         
         # Sum precipitation from previous 30 days
-        total_precip = 0.0
         start_step = max(0, current_step - 30)
-        for i in range(start_step, current_step):
-            total_precip += float(weather_data.iloc[i]["Precipitation"])
+        total_precip = float(weather_data["Precipitation"].iloc[start_step:current_step].to_numpy().sum())
         
-        self.logger.debug(f"Previous precipitation total: {total_precip}")
+        self.logger.debug("Previous precipitation total: %s", total_precip)
         return total_precip
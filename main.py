@@ -3,12 +3,16 @@ from textual.containers import HorizontalGroup, VerticalGroup, Container, Grid,
 from textual.screen import Screen, ModalScreen
 from textual.widgets import Label, Button, Rule, Input, TabbedContent, TabPane
 from textual import on
+from textual.reactive import reactive
+from typing import Callable, ClassVar, cast
 from typing_extensions import override
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import defaultdict
 from enum import Enum, auto
+from itertools import chain
+import functools
 
-import pyfiglet
-from aquacrop_manager import AquaCropManager
+from aquacrop_manager import AquaCropManager, SessionWeather
 
 import numpy as np
 
@@ -31,20 +35,39 @@ class TaskType(Enum):
 
 GAME_NAME = "FARMING SIM NAME TBD 2025"
 
-@dataclass
+# GAME_NAME never changes, so the banner is rendered once, on the first title screen push
+@functools.lru_cache(maxsize=1)
+def title_fig() -> str:
+    """Render the GAME_NAME figlet banner, importing pyfiglet on first use"""
+    import pyfiglet
+    return pyfiglet.figlet_format(GAME_NAME)
+
+# Sector ids of the 4x4 farm plot in row-major order, shared by every plot widget's grid
+_SECTOR_IDS: tuple[str, ...] = tuple(f"{row}{col}" for row in "ABCD" for col in range(1, 5))
+
+def _lerp_hex(start: tuple[int, int, int], end: tuple[int, int, int], t: float) -> str:
+    """Linearly interpolate between two RGB colours, returned as a #rrggbb string"""
+    r = int(start[0] + (end[0] - start[0]) * t)
+    g = int(start[1] + (end[1] - start[1]) * t)
+    b = int(start[2] + (end[2] - start[2]) * t)
+    return "#%06x" % ((r << 16) | (g << 8) | b)
+
+# Tasks are looked up by id, so the generated __eq__ isn't needed
+@dataclass(slots=True, eq=False)
 class Task:
     id: str
     description: str
     cost: int
     task_type: TaskType | None = None
-    cost_str: str = ""
     added_date: str = ""
-    
-    def __post_init__(self):
-        self.cost_str = f"{self.cost} AP"
 
+    @property
+    def cost_str(self) -> str:
+        """Cost as shown in the task grid"""
+        return f"{self.cost} AP"
 
-@dataclass
+
+@dataclass(slots=True)
 class GameState:
     aquacrop_manager: AquaCropManager
     date_str: str = ""
@@ -53,17 +76,33 @@ class GameState:
     previous_season: int = 1
     activity_points_used: int = 0
     max_activity_points: int = 4
+    # Sector canopy cover as of the last update, shared by every widget that redraws after a step
+    canopy_cover: dict[str, float] = field(default_factory=dict)
+    # The same values as an array in the manager's sector order, for vectorised widgets
+    canopy_values: np.ndarray = field(default_factory=lambda: np.empty(0))
+    # Tasks queued for the next step, keyed by id in display order
+    tasks: dict[str, Task] = field(default_factory=dict)
+    next_task_id: int = 1
+    # (date, task descriptions) of every journal entry so far
+    journal: list[tuple[str, list[str]]] = field(default_factory=list)
     
     def __post_init__(self):
         log.info("GameState post init")
         self.update_from_aquacrop()
     
-    def update_from_aquacrop(self) -> None:
-        """Update date and season from aquacrop manager"""
+    def update_from_aquacrop(self) -> bool:
+        """Update date and season from aquacrop manager, return True if either changed"""
         self.previous_season = self.current_season
-        self.current_season = self.aquacrop_manager.get_current_season()
-        self.date_str = self.aquacrop_manager.get_current_date()
-        self.season_str = f"Season {self.current_season}"
+        current_season = self.aquacrop_manager.get_current_season()
+        date_str = self.aquacrop_manager.get_current_date()
+        if date_str == self.date_str and current_season == self.current_season:
+            return False
+        self.current_season = current_season
+        self.date_str = date_str
+        self.season_str = f"Season {current_season}"
+        self.canopy_cover = self.aquacrop_manager.get_current_canopy_cover()
+        self.canopy_values = self.aquacrop_manager.get_canopy_cover_array()
+        return True
     
     def season_changed(self) -> bool:
         """Check if season has changed since last update"""
@@ -84,44 +123,45 @@ class GameState:
 
 class TitlePage(Screen[object]):
     def compose(self) -> ComposeResult:
-        title_fig = pyfiglet.figlet_format(GAME_NAME)
-        yield Label(title_fig, id="title_label")
+        yield Label(title_fig(), id="title_label")
         yield HorizontalGroup(Button("Start", id="start_btn"), Button("Options", id="opt_btn"), id="titlepage_menu_btns_grp")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "start_btn":
-            self.app.push_screen(GameScreen())
+            app = cast(FarmingSimApp, self.app)
+            self.app.push_screen(GameScreen(app.game_state))
 
 class DateSeasonDisplay(Container):
     def __init__(self, game_state: GameState, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.game_state: GameState = game_state
+        self.label: Label # created in compose
     
     def compose(self) -> ComposeResult:
-        yield Label(f"{self.game_state.date_str} | {self.game_state.season_str}", id="date_season_label")
+        self.label = Label(f"{self.game_state.date_str} | {self.game_state.season_str}", id="date_season_label")
+        yield self.label
 
+    def refresh_text(self) -> None:
+        """Show the game state's current date and season"""
+        self.label.update(f"{self.game_state.date_str} | {self.game_state.season_str}")
 
-class GameScreen(Screen[object]):
-    def compose(self) -> ComposeResult:
-        aquacrop_manager = AquaCropManager()
-        game_state = GameState(aquacrop_manager)
-        yield Container (
-            Label(GAME_NAME, id="game_title"),
-            DateSeasonDisplay(game_state, id="date_season_display"),
-            Input(placeholder="/help for help", id="command_input"),
-            Button("Back to title", id="back_btn"),
-        )
 
-    def compose_tabs(self) -> ComposeResult:
+class TabsContainer(Container):
+    def __init__(self, game_state: GameState, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.game_state: GameState = game_state
+
+    def compose(self) -> ComposeResult:
         """Compose tabbed content."""
-        aquacrop_manager = self.query_one("#date_season_display", DateSeasonDisplay).game_state.aquacrop_manager
+        game_state = self.game_state
+        aquacrop_manager = game_state.aquacrop_manager
         
         with TabbedContent(id="tabs"):
             with TabPane("Main", id="main_tab"):
                 yield HorizontalGroup(
                     FarmPlotVisible(aquacrop_manager, classes="farmplot"),
-                    TaskListAP(classes="task_list"),
-                    Journal(classes="journal_logs"),
+                    TaskListAP(game_state, classes="task_list"),
+                    Journal(game_state, classes="journal_logs"),
                 )
             with TabPane("Data", id="data_tab"):
                 yield HorizontalGroup(
@@ -130,99 +170,118 @@ class GameScreen(Screen[object]):
                     SoilMoistureWidget(aquacrop_manager, id="moisture_widget", classes="moistureplot"),
                 )
 
-    def on_mount(self) -> None:
+
+class GameScreen(Screen[object]):
+    # /tab argument -> TabPane id, matching the panes built in TabsContainer
+    _VALID_TABS: ClassVar[dict[str, str]] = {"main": "main_tab", "data": "data_tab"}
+
+    def __init__(self, game_state: GameState | None = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The app passes its shared game state in, so leaving and restarting resumes the same game;
+        # the fallback is for a standalone screen
+        self.game_state: GameState = game_state or GameState(AquaCropManager())
+        # Widgets the command handlers use, looked up once in on_mount
+        self._date_display: DateSeasonDisplay
+        self._command_input: Input
+        self._tabs: TabbedContent
+        self._farm_plot: FarmPlotVisible
+        self._ndvi_plot: NDVIDataWidget
+        self._task_list: TaskListAP
+        self._weather_widget: WeatherWidget
+
+        # Commands that take no arguments, matched exactly
+        self._exact_commands: dict[str, Callable[[], None]] = {
+            "/help": self.handle_help,
+            "/step": self.handle_step_simulation,
+            "/canopy": self.handle_show_canopy,
+        }
+        # Commands that take arguments, keyed by their first word; the handler gets the rest, stripped
+        self._arg_commands: dict[str, Callable[[str], None]] = {
+            "/task": self.handle_task,
+            "/tab": self.handle_tab_switch,
+        }
+        # /task subcommands, keyed by the word after /task
+        self._task_commands: dict[str, Callable[[str], None]] = {
+            "add": self.handle_task_add,
+            "remove": self.handle_task_remove,
+        }
+
+    def compose(self) -> ComposeResult:
+        yield Container (
+            Label(GAME_NAME, id="game_title"),
+            DateSeasonDisplay(self.game_state, id="date_season_display"),
+            Input(placeholder="/help for help", id="command_input"),
+            Button("Back to title", id="back_btn"),
+        )
+
+    async def on_mount(self) -> None:
         """Mount the tabbed content after the main container."""
         # Get the container and mount tabbed content
         container = self.query_one(Container)
-        tabs_container = Container(id="tabs_container")
-        tabs_container.compose = self.compose_tabs
-        container.mount(tabs_container, after="#game_title")
-        
-        # Update farm plot colors after mounting with a small delay
-        self.set_timer(0.1, self.update_farm_plot_colors)
-        self.set_timer(0.1, self.update_ndvi_plot_colors)
-        self.set_timer(0.1, self.update_moisture_plot_colors)
-        
+        tabs_container = TabsContainer(self.game_state, id="tabs_container")
+        await container.mount(tabs_container, after="#game_title")
+
+        # The command handlers reach these on every command, so look them up once (declared in __init__)
+        self._date_display = self.query_one("#date_season_display", DateSeasonDisplay)
+        self._command_input = self.query_one("#command_input", Input)
+        self._tabs = self.query_one("#tabs", TabbedContent)
+        self._farm_plot = self.query_one(".farmplot", FarmPlotVisible)
+        self._ndvi_plot = self.query_one(".ndviplot", NDVIDataWidget)
+        self._task_list = self.query_one(".task_list", TaskListAP)
+        self._weather_widget = self.query_one("#weather_widget", WeatherWidget)
+
     @on(TabbedContent.TabActivated)
     def on_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         """Handle tab activation events"""
         if event.tab.id == "data_tab":
             # Update weather data when data tab becomes active
-            weather_widget = self.query_one("#weather_widget", WeatherWidget)
-            if weather_widget:
-                weather_widget.update_weather_data()
+            self._weather_widget.update_weather_data()
     
-    def update_farm_plot_colors(self) -> None:
-        """Update farm plot colors after components are mounted"""
-        log.info("Updating farm plot colours")
-        farm_plot = self.query_one(".farmplot", FarmPlotVisible)
-        if farm_plot:
-            farm_plot.update_sector_colors()
-
-    def update_ndvi_plot_colors(self) -> None:
-        """Update farm plot colors after components are mounted"""
-        log.info("Updating ndvi plot colours")
-        ndvi_plot = self.query_one(".ndviplot", NDVIDataWidget)
-        if ndvi_plot:
-            ndvi_plot.update_sector_colors()
-
-    def update_moisture_plot_colors(self) -> None:
-        """Update moisture plot colors after components are mounted"""
-        log.info("Updating moisture plot colours")
-        moisture_plot = self.query_one(".moistureplot", SoilMoistureWidget)
-        if moisture_plot:
-            moisture_plot.update_sector_colors()
-
-    def handle_tab_switch(self, command: str) -> None:
+    def handle_tab_switch(self, args: str) -> None:
         """Handle /tab [tab_name] command"""
-        if not command.startswith("/tab "):
-            self.app.bell()  # Alert sound for invalid command
-            return
-        
-        tab_name = command[len("/tab "):].strip().lower()
-        
-        # Get the TabbedContent widget
-        tabs = self.query_one("#tabs", TabbedContent)
+        tab_name = args.lower()
         
         # Validate tab name and switch
-        valid_tabs = {"main": "main_tab", "data": "data_tab"}
+        tab_id = self._VALID_TABS.get(tab_name)
         
-        if tab_name in valid_tabs:
-            tabs.active = valid_tabs[tab_name]
-            command_input = self.query_one("#command_input", Input)
-            command_input.value = ""  # Clear input
+        if tab_id is not None:
+            self._tabs.active = tab_id
+            self._command_input.value = ""  # Clear input
         else:
             self.app.bell()  # Invalid tab name
 
     @on(Input.Submitted, "#command_input")
     def handle_command(self, event: Input.Submitted) -> None:
         command = event.value.strip()
-        print(f"Command received: '{command}'")  # Debug
-        if command == "/help":
-            self.app.push_screen(HelpModal())
-        elif command == "/step":
-            self.handle_step_simulation()
-        elif command == "/canopy":
-            self.handle_show_canopy()
-        elif command.startswith("/task add"):
-            self.handle_task_add(command)
-        elif command.startswith("/task remove"):
-            self.handle_task_remove(command)
-        elif command.startswith("/tab"):
-            self.handle_tab_switch(command)
+        log.debug("Command received: '%s'", command)
+        handler = self._exact_commands.get(command)
+        if handler is not None:
+            handler()
+            return
+        verb, _, args = command.partition(" ")
+        arg_handler = self._arg_commands.get(verb)
+        if arg_handler is not None:
+            arg_handler(args.strip())
+
+    def handle_task(self, args: str) -> None:
+        """Handle /task [add|remove] ... by dispatching on the subcommand"""
+        subcommand, _, sub_args = args.partition(" ")
+        handler = self._task_commands.get(subcommand)
+        if handler is None:
+            self.app.bell()  # Alert sound for invalid command
+            return
+        handler(sub_args.strip())
+
+    def handle_help(self) -> None:
+        """Handle /help command"""
+        self.app.push_screen(HelpModal())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back_btn":
             self.app.pop_screen()
     
-    def handle_task_add(self, command: str) -> None:
+    def handle_task_add(self, params: str) -> None:
         """Handle /task add [type] [params] command"""
-        if not command.startswith("/task add "):
-            self.app.bell()  # Alert sound for invalid command
-            return
-        
-        # Extract everything after "/task add "
-        params = command[len("/task add "):].strip()
         if not params:
             self.app.bell()
             return
@@ -259,88 +318,77 @@ class GameScreen(Screen[object]):
             self.app.bell()  # Invalid command format
             return
         
-        # Find the task list component and add the task
-        task_list = self.query_one(".task_list", TaskListAP)
-        if task_list:
-            if task_list.add_task(description, task_type_enum, cost):
-                command_input = self.query_one("#command_input", Input)
-                command_input.value = ""  # Clear input
+        # Add the task to the task list
+        if self._task_list.add_task(description, task_type_enum, cost):
+            self._command_input.value = ""  # Clear input
     
-    def handle_task_remove(self, command: str) -> None:
+    def handle_task_remove(self, args: str) -> None:
         """Handle /task remove [task_id] command"""
-        # Extract task ID after "/task remove "
-        if not command.startswith("/task remove "):
-            self.app.bell()
-            return
-        
-        task_id = command[len("/task remove "):].strip().upper()
+        task_id = args.upper()
         if not task_id:
             self.app.bell()
             return
         
-        # Find the task list component and remove the task
-        task_list = self.query_one(".task_list", TaskListAP)
-        if task_list:
-            if task_list.remove_task(task_id):
-                command_input = self.query_one("#command_input", Input)
-                command_input.value = ""  # Clear input
-            else:
-                self.app.bell()  # Task not found
+        # Remove the task from the task list
+        if self._task_list.remove_task(task_id):
+            self._command_input.value = ""  # Clear input
+        else:
+            self.app.bell()  # Task not found
 
     def handle_step_simulation(self) -> None:
         """Handle /step command - advance simulation by 30 days"""
-        game_state = self.query_one("#date_season_display", DateSeasonDisplay).game_state
+        game_state = self._date_display.game_state
         
         # Get current tasks before resetting
-        task_list = self.query_one(".task_list", TaskListAP)
-        tasks_with_dates = [(game_state.date_str, task.description) for task in task_list.tasks] if task_list else []
+        task_list = self._task_list
+        tasks_with_dates = [(game_state.date_str, task.description) for task in task_list.tasks.values()]
         
         game_state.aquacrop_manager.step_simulation(30)
-        game_state.update_from_aquacrop()
+        date_changed = game_state.update_from_aquacrop()
         
         # Reset activity points for new step
         game_state.reset_activity_points()
         
         # Update the display label
-        date_season_label = self.query_one("#date_season_label", Label)
-        date_season_label.update(f"{game_state.date_str} | {game_state.season_str}")
+        if date_changed:
+            self._date_display.refresh_text()
         
         # Update farm plot colors
-        farm_plot = self.query_one(".farmplot", FarmPlotVisible)
-        if farm_plot:
-            farm_plot.update_sector_colors()
+        self._farm_plot.update_sector_colors(game_state.canopy_cover)
 
         # Update ndvi plot colors
-        ndvi_plot = self.query_one(".ndviplot", NDVIDataWidget)
-        if ndvi_plot:
-            ndvi_plot.update_sector_colors()
+        self._ndvi_plot.update_sector_colors(game_state.canopy_values)
+
+        # Push the new session's weather; the widget only redraws if it changed
+        self._weather_widget.update_weather_data()
         
         # Add journal entries for tasks (grouped by date)
         if tasks_with_dates:
             self.add_journal_entries(tasks_with_dates)
         
         # Clear tasks for next step
-        if task_list:
-            task_list.tasks.clear()
-            task_list.refresh_task_display()
+        task_list.clear_tasks()
         
         # Check if season changed and show modal
         if game_state.season_changed():
             self.app.push_screen(SeasonStatsModal(game_state.current_season))
         
-        command_input = self.query_one("#command_input", Input)
-        command_input.value = ""  # Clear input
-        print("Simulation stepped forward 30 days")
+        self._command_input.value = ""  # Clear input
+        log.debug("Simulation stepped forward 30 days")
     
     def add_journal_entries(self, tasks_with_dates: list[tuple[str, str]]) -> None:
         """Add journal entries grouped by date"""
         journal = self.query_one(".journal_logs", Journal)
-        if journal:
+        if journal and tasks_with_dates:
+            # Tasks from a single step all share its date, so that case needs no grouping
+            first_date = tasks_with_dates[0][0]
+            if all(date_str == first_date for date_str, _ in tasks_with_dates):
+                journal.add_entry(first_date, [task_desc for _, task_desc in tasks_with_dates])
+                return
+
             # Group tasks by date
-            tasks_by_date: dict[str, list[str]] = {}
+            tasks_by_date: defaultdict[str, list[str]] = defaultdict(list)
             for date_str, task_desc in tasks_with_dates:
-                if date_str not in tasks_by_date:
-                    tasks_by_date[date_str] = []
                 tasks_by_date[date_str].append(task_desc)
             
             # Add entries for each date
@@ -349,64 +397,62 @@ class GameScreen(Screen[object]):
 
     def handle_show_canopy(self) -> None:
         """Handle /canopy command - show current canopy cover values"""
-        game_state = self.query_one("#date_season_display", DateSeasonDisplay).game_state
-        canopy_cover = game_state.aquacrop_manager.get_current_canopy_cover()
+        game_state = self._date_display.game_state
+        canopy_cover = game_state.canopy_cover
         
-        print("Current Canopy Cover Values:")
-        for sector_id, cover in canopy_cover.items():
-            print(f"{sector_id}: {cover:.3f}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Current Canopy Cover Values: %s",
+                      ", ".join(f"{sector_id}: {cover:.3f}" for sector_id, cover in canopy_cover.items()))
         
         # Update farm plot colors
-        farm_plot = self.query_one(".farmplot", FarmPlotVisible)
-        if farm_plot:
-            farm_plot.update_sector_colors()
+        self._farm_plot.update_sector_colors(canopy_cover)
         
-        command_input = self.query_one("#command_input", Input)
-        command_input.value = ""  # Clear input
+        self._command_input.value = ""  # Clear input
 
 class TaskListAP(Container):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, game_state: GameState, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.tasks: list[Task] = []
-        self.next_task_id = 1
+        self.game_state: GameState = game_state
+        # The game state's task dict, so queued tasks outlive this widget
+        self.tasks: dict[str, Task] = game_state.tasks
+        # Grid cells of each task's row, so a row can be unmounted without touching the others
+        self._task_rows: dict[str, tuple[Label, Label, Label]] = {}
+        self._task_grid: Grid # built in compose by build_task_grid
     
     def compose(self) -> ComposeResult:
         yield Label("Tasks:", id="tasks_title")
         
         # Add AP usage display
-        game_state = self.get_game_state()
-        if game_state:
-            yield Label(f"AP Used: {game_state.activity_points_used}/{game_state.max_activity_points}", 
-                       id="ap_display")
-        
-        taskGrid = Grid(
-            *[widget for task in self.tasks 
-              for widget in (
-                  Label(task.id, classes="task_id"),
-                  Label(task.description, classes="task_desc"),
-                  Label(task.cost_str, classes="task_cost")
-              )],
+        game_state = self.game_state
+        yield Label(f"AP Used: {game_state.activity_points_used}/{game_state.max_activity_points}", 
+                   id="ap_display")
+        
+        yield self.build_task_grid()
+
+    def build_task_grid(self) -> Grid:
+        """Grid holding one row of cells per current task"""
+        self._task_rows = {task_id: self.task_row(task) for task_id, task in self.tasks.items()}
+        self._task_grid = Grid(
+            *chain.from_iterable(self._task_rows.values()),
             classes="task_grid_list"
         )
-        yield taskGrid
-    
-    def get_game_state(self) -> GameState | None:
-        """Get the current game state from parent screen"""
-        screen = self.screen
-        if screen and hasattr(screen, 'query_one'):
-            try:
-                date_display = screen.query_one("#date_season_display", DateSeasonDisplay)
-                return date_display.game_state
-            except Exception:
-                return None
-        return None
+        return self._task_grid
     
+    @staticmethod
+    def task_row(task: Task) -> tuple[Label, Label, Label]:
+        """Grid cells for one task"""
+        return (
+            Label(task.id, classes="task_id"),
+            Label(task.description, classes="task_desc"),
+            Label(task.cost_str, classes="task_cost"),
+        )
+
     def add_task(self, description: str, task_type: TaskType | None = None, cost: int = 1) -> bool:
         """Add a new task with validation, return True if successful"""
-        game_state = self.get_game_state()
+        game_state = self.game_state
         
         # Check if task can be added without exceeding AP limit
-        if game_state and not game_state.can_add_task(cost):
+        if not game_state.can_add_task(cost):
             self.app.bell()  # Alert for AP limit exceeded
             # Show error modal
             self.app.push_screen(ActivityPointsModal(
@@ -416,68 +462,51 @@ class TaskListAP(Container):
             ))
             return False
         
-        # Get current date for journal
-        current_date = game_state.date_str if game_state else ""
-        
-        new_task = Task(f"T{self.next_task_id}", description, cost, task_type, current_date)
-        self.tasks.append(new_task)
-        self.next_task_id += 1
+        new_task = Task(f"T{game_state.next_task_id}", description, cost, task_type, game_state.date_str)
+        self.tasks[new_task.id] = new_task
+        game_state.next_task_id += 1
         
         # Add activity points
-        if game_state:
-            game_state.add_activity_points(cost)
+        game_state.add_activity_points(cost)
         
-        # Refresh the task list display
-        self.refresh_task_display()
+        # Append the new task's row to the existing grid rather than rebuilding it
+        row = self.task_row(new_task)
+        self._task_rows[new_task.id] = row
+        self._task_grid.mount(*row)
+        self.update_ap_display()
         
         return True
     
     def remove_task(self, task_id: str) -> bool:
         """Remove a task by ID, return True if successful"""
-        # Find the task to remove
-        task_to_remove = None
-        for task in self.tasks:
-            if task.id == task_id:
-                task_to_remove = task
-                break
-        
-        if not task_to_remove:
-            return False  # Task not found
-        
         # Remove the task and refund AP
-        self.tasks.remove(task_to_remove)
+        task_to_remove = self.tasks.pop(task_id, None)
+        if task_to_remove is None:
+            return False  # Task not found
         
-        game_state = self.get_game_state()
-        if game_state:
-            game_state.activity_points_used = max(0, game_state.activity_points_used - task_to_remove.cost)
+        game_state = self.game_state
+        game_state.activity_points_used = max(0, game_state.activity_points_used - task_to_remove.cost)
         
-        # Refresh the task list display
-        self.refresh_task_display()
+        # Drop just that task's row from the grid
+        for cell in self._task_rows.pop(task_id):
+            cell.remove()
+        self.update_ap_display()
         
         return True  # Task successfully removed
     
-    def refresh_task_display(self) -> None:
-        """Refresh the entire task list display including AP counter"""
-        # Remove existing displays
-        self.query(".task_grid_list").remove()
-        
-        # Update AP display instead of recreating it
-        game_state = self.get_game_state()
+    def update_ap_display(self) -> None:
+        """Update the AP counter label in place"""
+        game_state = self.game_state
         ap_display = self.query_one("#ap_display", Label)
-        if ap_display and game_state:
+        if ap_display:
             ap_display.update(f"AP Used: {game_state.activity_points_used}/{game_state.max_activity_points}")
-        
-        # Add task grid
-        taskGrid = Grid(
-            *[widget for task in self.tasks 
-              for widget in (
-                  Label(task.id, classes="task_id"),
-                  Label(task.description, classes="task_desc"),
-                  Label(task.cost_str, classes="task_cost")
-              )],
-            classes="task_grid_list"
-        )
-        self.mount(taskGrid)
+
+    def clear_tasks(self) -> None:
+        """Drop every task and its grid row, and refresh the AP counter"""
+        self.tasks.clear()
+        self._task_rows.clear()
+        self._task_grid.remove_children()
+        self.update_ap_display()
 
 class CommandLine(Input):
     def compose(self) -> ComposeResult:
@@ -498,205 +527,169 @@ class JournalEntry(VerticalGroup):
             yield Label(f"- {task}")
 
 class Journal(VerticalScroll):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, game_state: GameState, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.game_state: GameState = game_state
         self.entries: list[JournalEntry] = []
     
     def compose(self) -> ComposeResult:
-        for entry in self.entries:
-            yield entry
+        # The history lives on the game state, so a new game screen shows earlier entries too
+        self.entries = [JournalEntry(date_str, tasks) for date_str, tasks in self.game_state.journal]
+        yield from self.entries
     
     def add_entry(self, date_str: str, tasks: list[str]) -> None:
         """Add a new journal entry"""
+        self.game_state.journal.append((date_str, tasks))
         new_entry = JournalEntry(date_str, tasks)
         self.entries.append(new_entry)
         
-        # Refresh journal display
-        self.query(JournalEntry).remove()
-        for entry in self.entries:
-            self.mount(entry)
+        # Earlier entries are already mounted, so only the new one needs adding
+        self.mount(new_entry)
+        new_entry.scroll_visible()
 
 class SoilMoistureWidget(Grid):
     """ The farm plot is hardcoded to be 4x4 for the purposes of this hackathon """
 
+    # Colours between #678598 (0.1) and #1496f4 (0.2), precomputed at 1/255 steps of that range
+    _COLOR_LUT: tuple[str, ...] = tuple(
+        _lerp_hex((0x67, 0x85, 0x98), (0x14, 0x96, 0xf4), i / 255) for i in range(256)
+    )
+
     def __init__(self, aquacrop_manager: AquaCropManager, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.aquacrop_manager = aquacrop_manager
+        self._sector_widgets: dict[str, Label] = {}
 
     def compose(self) -> ComposeResult:
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        height = 4
-        width = 4
-
         #total accessible water
         taw = self.aquacrop_manager.get_current_hydration()
 
-        grid = [
-                [ Label(f"{taw[row + str(col)]:.1f}", id=f"moistureplot_{row}{col}", classes="sector") for col in range(1,width+1)]
-            for row in alphabet[0:height]
-        ]
-        for r in range(0, height):
-            for c in range(0, width):
-                yield grid[r][c]
-        
-        # Initial color update
+        for sector_id in _SECTOR_IDS:
+            label = Label(f"{taw[sector_id]:.1f}", id=f"moistureplot_{sector_id}", classes="sector")
+            self._sector_widgets[sector_id] = label
+            yield label
+
+    def on_mount(self) -> None:
+        """Initial color update, once the sector labels are in the DOM"""
         self.update_sector_colors()
 
     def interpolate_color(self, value: float) -> str:
-        # Convert hex colors to RGB components
-        start_color = (0x67, 0x85, 0x98) # #678598
-        end_color = (0x14, 0x96, 0xf4) # #1496f4
-        
         # typical theta 0.2 - 0.5
         # Clamp value between 0 and 1
         value = max(0.1, min(0.2, value))
         normalized_value = (value - 0.1) / (0.2 - 0.1)
         
-        # Interpolate each RGB component
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * normalized_value)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * normalized_value)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * normalized_value)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return self._COLOR_LUT[int(normalized_value * 255)]
 
     def update_sector_colors(self) -> None:
         """Update sector background colors based on canopy cover values"""
         log.info("updating sector colours for moisture")
         hydration = self.aquacrop_manager.get_current_hydration()
-        log.info(f"hydration: {hydration}")
+        log.debug("hydration: %s", hydration)
 
         for sector_id, hydration_value in hydration.items():
-            try:
-                sector_widget = self.query_one(f"#moistureplot_{sector_id}", Label)
-                color = self.interpolate_color(hydration_value)
-                sector_widget.content = f"{hydration_value:.1f}"
-                sector_widget.styles.background = color
-            except Exception:
-                # Widget might not be mounted yet
-                pass
+            sector_widget = self._sector_widgets.get(sector_id)
+            if sector_widget is None:
+                # Widget might not be composed yet
+                continue
+            color = self.interpolate_color(hydration_value)
+            sector_widget.content = f"{hydration_value:.1f}"
+            sector_widget.styles.background = color
 
 class NDVIDataWidget(Grid):
     """ The farm plot is hardcoded to be 4x4 for the purposes of this hackathon """
 
+    # Below, at and above the median canopy cover; the colours live in fs.tcss
+    _MEDIAN_BAND_CLASSES: ClassVar[tuple[str, str, str]] = ("below_median", "at_median", "above_median")
+
     def __init__(self, aquacrop_manager: AquaCropManager, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.aquacrop_manager = aquacrop_manager
+        self._sector_widgets: dict[str, Label] = {}
 
     def compose(self) -> ComposeResult:
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        height = 4
-        width = 4
-
         cc = self.aquacrop_manager.get_current_canopy_cover()
 
-        grid = [
-                [ Label(f"{cc[row + str(col)]:.1f}", id=f"ndviplot_{row}{col}", classes="sector") for col in range(1,width+1)]
-            for row in alphabet[0:height]
-        ]
-        for r in range(0, height):
-            for c in range(0, width):
-                yield grid[r][c]
-        
-        # Initial color update
-        self.update_sector_colors()
-
-    def interpolate_color(self, value: float) -> str:
-        """Interpolate between #b49850 (0.0) and #4b702e (1.0) based on canopy cover"""
-        # Convert hex colors to RGB components
-        start_color = (0xb4, 0x98, 0x50)  # #b49850
-        end_color = (0x4b, 0x70, 0x2e)    # #4b702e
-        
-        # Clamp value between 0 and 1
-        value = max(0.0, min(1.0, value))
-        
-        # Interpolate each RGB component
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * value)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * value)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * value)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def update_sector_colors(self) -> None:
+        for sector_id in _SECTOR_IDS:
+            label = Label(f"{cc[sector_id]:.1f}", id=f"ndviplot_{sector_id}", classes="sector")
+            self._sector_widgets[sector_id] = label
+            yield label
 
-        below_median_colour = "#8b2323"
-        median_colour = "#897600"
-        above_median_colour = "#44b342"
+    def on_mount(self) -> None:
+        """Initial color update, once the sector labels are in the DOM"""
+        self.update_sector_colors()
 
-        """Update sector background colors based on canopy cover values"""
+    def update_sector_colors(self, cover_values: np.ndarray | None = None) -> None:
+        """Update sector background colors based on canopy cover values, fetched if not given"""
         log.info("updating sector colours for ndvi")
-        canopy_cover = self.aquacrop_manager.get_current_canopy_cover()
-        log.info(f"canopy cover: {canopy_cover}")
+        if cover_values is None:
+            cover_values = self.aquacrop_manager.get_canopy_cover_array()
+        sector_ids = self.aquacrop_manager.get_sector_ids()
+        log.debug("canopy cover: %s", cover_values)
 
-        median_cc = np.median([cover_value for _, cover_value in canopy_cover.items()])
-        log.info(f"canop median: {median_cc}")
+        median_cc = np.median(cover_values)
+        log.debug("canop median: %s", median_cc)
 
-        for sector_id, cover_value in canopy_cover.items():
-            try:
-                sector_widget = self.query_one(f"#ndviplot_{sector_id}", Label)
-                if cover_value < median_cc:
-                    sector_widget.styles.background = below_median_colour
-                elif cover_value > median_cc:
-                    sector_widget.styles.background = above_median_colour
-                else:
-                    sector_widget.styles.background = median_colour
+        # Band index per sector: 0 below the median, 1 at it, 2 above it
+        bands = (cover_values >= median_cc).astype(np.intp) + (cover_values > median_cc)
+        band_classes = self._MEDIAN_BAND_CLASSES
 
-                sector_widget.content = f"{cover_value:.1f}"
-            except Exception:
-                # Widget might not be mounted yet
-                pass
+        for sector_id, cover_value, band in zip(sector_ids, cover_values.tolist(), bands.tolist()):
+            sector_widget = self._sector_widgets.get(sector_id)
+            if sector_widget is None:
+                # Widget might not be composed yet
+                continue
+            # set_class only restyles when membership actually changes
+            for i, band_class in enumerate(band_classes):
+                sector_widget.set_class(i == band, band_class)
+            sector_widget.content = f"{cover_value:.1f}"
 
 
 class FarmPlotVisible(Grid):
     """ The farm plot is hardcoded to be 4x4 for the purposes of this hackathon """
 
+    # Colours between #b49850 (0.0) and #4b702e (1.0), precomputed at 1/255 steps of canopy cover
+    _COLOR_LUT: tuple[str, ...] = tuple(
+        _lerp_hex((0xb4, 0x98, 0x50), (0x4b, 0x70, 0x2e), i / 255) for i in range(256)
+    )
+
     def __init__(self, aquacrop_manager: AquaCropManager, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.aquacrop_manager = aquacrop_manager
+        self._sector_widgets: dict[str, Label] = {}
+        self._last_color: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
-        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        height = 4
-        width = 4
-
-        grid = [
-            [ Label(f"{row}{col}", id=f"farmplot_{row}{col}", classes="sector") for col in range(1,width+1)]
-            for row in alphabet[0:height]
-        ]
-        for r in range(0, height):
-            for c in range(0, width):
-                yield grid[r][c]
-        
-        # Initial color update
+        for sector_id in _SECTOR_IDS:
+            label = Label(sector_id, id=f"farmplot_{sector_id}", classes="sector")
+            self._sector_widgets[sector_id] = label
+            yield label
+
+    def on_mount(self) -> None:
+        """Initial color update, once the sector labels are in the DOM"""
         self.update_sector_colors()
 
     def interpolate_color(self, value: float) -> str:
-        """Interpolate between #b49850 (0.0) and #4b702e (1.0) based on canopy cover"""
-        # Convert hex colors to RGB components
-        start_color = (0xb4, 0x98, 0x50)  # #b49850
-        end_color = (0x4b, 0x70, 0x2e)    # #4b702e
-        
-        # Clamp value between 0 and 1
-        value = max(0.0, min(1.0, value))
-        
-        # Interpolate each RGB component
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * value)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * value)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * value)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def update_sector_colors(self) -> None:
-        """Update sector background colors based on canopy cover values"""
-        canopy_cover = self.aquacrop_manager.get_current_canopy_cover()
-        
-        for sector_id, cover_value in canopy_cover.items():
-            try:
-                sector_widget = self.query_one(f"#farmplot_{sector_id}", Label)
+        """Look up the #b49850 (0.0) to #4b702e (1.0) colour for a canopy cover value"""
+        return self._COLOR_LUT[int(max(0.0, min(1.0, value)) * 255)]
+
+    def update_sector_colors(self, canopy_cover: dict[str, float] | None = None) -> None:
+        """Update sector background colors based on canopy cover values, fetched if not given"""
+        if canopy_cover is None:
+            canopy_cover = self.aquacrop_manager.get_current_canopy_cover()
+        last_color = self._last_color
+        
+        # Only restyle sectors whose colour changed, and repaint them all at once
+        with self.app.batch_update():
+            for sector_id, cover_value in canopy_cover.items():
+                sector_widget = self._sector_widgets.get(sector_id)
+                if sector_widget is None:
+                    # Widget might not be composed yet
+                    continue
                 color = self.interpolate_color(cover_value)
-                sector_widget.styles.background = color
-            except Exception:
-                # Widget might not be mounted yet
-                pass
+                if last_color.get(sector_id) != color:
+                    sector_widget.styles.background = color
+                    last_color[sector_id] = color
 
 class HelpModal(ModalScreen[object]):
     """Modal screen showing available commands"""
@@ -770,19 +763,32 @@ class ActivityPointsModal(ModalScreen[object]):
 
 class WeatherWidget(Container):
     """Widget to display weather information"""
+
+    # (previous, forecast) session weather; watch_weather_state redraws the labels only when it changes
+    weather_state: reactive[tuple[SessionWeather | None, SessionWeather] | None] = reactive(None, repaint=False, init=False)
     
     def __init__(self, aquacrop_manager: AquaCropManager, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.aquacrop_manager: AquaCropManager = aquacrop_manager
+        # Data labels, created in compose
+        self._prev_temp: Label
+        self._prev_precip: Label
+        self._forecast_precip: Label
+        self._forecast_temp: Label
     
     @override
     def compose(self) -> ComposeResult:
         yield Label("Weather Data", id="weather_title")
+        # Kept so update_weather_data can write to them without querying the DOM
+        self._prev_temp = Label("Previous session temperature: Loading...", id="prev_temp_label")
+        self._prev_precip = Label("Previous session precipitation: Loading...", id="prev_precip_label")
+        self._forecast_precip = Label("Forecasted precipitation: Loading...", id="forecast_precip_label")
+        self._forecast_temp = Label("Forecasted temperature range: Loading...", id="forecast_temp_label")
         yield VerticalGroup(
-            Label("Previous session temperature: Loading...", id="prev_temp_label"),
-            Label("Previous session precipitation: Loading...", id="prev_precip_label"),
-            Label("Forecasted precipitation: Loading...", id="forecast_precip_label"),
-            Label("Forecasted temperature range: Loading...", id="forecast_temp_label"),
+            self._prev_temp,
+            self._prev_precip,
+            self._forecast_precip,
+            self._forecast_temp,
             id="weather_data_group"
         )
     
@@ -792,34 +798,21 @@ class WeatherWidget(Container):
     
     def update_weather_data(self) -> None:
         """Update weather data display"""
-        # Get the game state
-        gs = self.get_game_state()
+        self.weather_state = self.aquacrop_manager.weather_data()
 
-        prev, forecast = gs.aquacrop_manager.weather_data()
+    def watch_weather_state(self, weather: tuple[SessionWeather | None, SessionWeather] | None) -> None:
+        """Redraw the weather labels for new session weather"""
+        if weather is None:
+            return
+        prev, forecast = weather
 
         # Update labels
-        prev_temp_label = self.query_one("#prev_temp_label", Label)
-        prev_precip_label = self.query_one("#prev_precip_label", Label)
-        forecast_precip_label = self.query_one("#forecast_precip_label", Label)
-        forecast_temp_label = self.query_one("#forecast_temp_label", Label)
-
         if prev:
-            prev_temp_label.update(f"Previous session temperature: {prev.min_temp:.1f}°C to {prev.max_temp:.1f}°C")
-            prev_precip_label.update(f"Previous session precipitation: {prev.precipitation:.1f} mm")
+            self._prev_temp.update(f"Previous session temperature: {prev.min_temp:.1f}°C to {prev.max_temp:.1f}°C")
+            self._prev_precip.update(f"Previous session precipitation: {prev.precipitation:.1f} mm")
         
-        forecast_precip_label.update(f"Forecasted precipitation: {forecast.precipitation:.1f} mm")
-        forecast_temp_label.update(f"Temperature range: {forecast.min_temp:.1f}°C to {forecast.max_temp:.1f}°C")
-
-    def get_game_state(self) -> GameState | None:
-        """Get the current game state from parent screen"""
-        screen = self.screen
-        if screen and hasattr(screen, 'query_one'):
-            try:
-                date_display = screen.query_one("#date_season_display", DateSeasonDisplay)
-                return date_display.game_state
-            except Exception:
-                return None
-        return None
+        self._forecast_precip.update(f"Forecasted precipitation: {forecast.precipitation:.1f} mm")
+        self._forecast_temp.update(f"Temperature range: {forecast.min_temp:.1f}°C to {forecast.max_temp:.1f}°C")
 
 
 class FarmingSimApp(App[object]):
@@ -827,6 +820,16 @@ class FarmingSimApp(App[object]):
 
     CSS_PATH = "fs.tcss"
 
+    # One simulation for the whole app, built on first use so the title screen shows straight away
+    @functools.cached_property
+    def aquacrop_manager(self) -> AquaCropManager:
+        return AquaCropManager()
+
+    # Likewise one game state, so tasks and the journal survive going back to the title screen
+    @functools.cached_property
+    def game_state(self) -> GameState:
+        return GameState(self.aquacrop_manager)
+
     def on_mount(self) -> None:
         self.push_screen(TitlePage(id = "titlescreen"))
 